@@ -3,9 +3,14 @@
 # Email: tinprocoder0908@gmail.com
 
 import os
+import json
+import functools
+import queue
 import requests
-from dataclasses import dataclass, asdict
-from typing import Literal, Tuple
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, fields
+from typing import Literal, Optional, Tuple
 from tqdm import tqdm
 import torch.cuda
 import yaml
@@ -44,71 +49,180 @@ MODEL_URLS = {
 }
 
 
+CACHE_ROOT = os.environ.get('FACE2VID_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'face2vid'))
+MANIFEST_FILENAME = 'manifest.json'
+COMPLETE_SENTINEL = '.complete'
+
+DOWNLOAD_WORKERS = 8
+
+# Shared session so downloads reuse keep-alive connections to the model hub
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=DOWNLOAD_WORKERS, pool_maxsize=DOWNLOAD_WORKERS))
+
+# Config fields resolved from the downloaded checkpoints, mapped to their MODEL_URLS entry
+CHECKPOINT_FIELDS = {
+    'grid_sample_3d': ('live_portrait', 'grid_sample_3d'),
+    # ONNX
+    'checkpoint_F': ('live_portrait', 'F_onnx'),
+    'checkpoint_M': ('live_portrait', 'M_onnx'),
+    'checkpoint_GW': ('live_portrait', 'GW_onnx'),
+    'checkpoint_S': ('live_portrait', 'S_onnx'),
+    'checkpoint_SE': ('live_portrait', 'SE_onnx'),
+    'checkpoint_SL': ('live_portrait', 'SL_onnx'),
+    # TensorRT FP32
+    'F_rt': ('live_portrait', 'F_rt'),
+    'M_rt': ('live_portrait', 'M_rt'),
+    'GW_rt': ('live_portrait', 'GW_rt'),
+    'S_rt': ('live_portrait', 'S_rt'),
+    'SE_rt': ('live_portrait', 'SE_rt'),
+    'SL_rt': ('live_portrait', 'SL_rt'),
+    # TensorRT FP16
+    'F_rt_half': ('live_portrait', 'F_rt_half'),
+    'M_rt_half': ('live_portrait', 'M_rt_half'),
+    'GW_rt_half': ('live_portrait', 'GW_rt_half'),
+    'S_rt_half': ('live_portrait', 'S_rt_half'),
+    'SE_rt_half': ('live_portrait', 'SE_rt_half'),
+    'SL_rt_half': ('live_portrait', 'SL_rt_half'),
+    # crop config
+    'ckpt_landmark': ('insightface', 'landmark'),
+    'ckpt_arc_face': ('insightface', 'arc_face'),
+    'ckpt_landmark_106': ('insightface', '2d106det'),
+    'ckpt_det': ('insightface', 'det_10g'),
+}
+
+
+def load_manifest(dir_path):
+    # Expected checkpoint sizes recorded next to the weights, keyed by filename
+    manifest_path = os.path.join(dir_path, MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return {}
+    try:
+        with open(manifest_path, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(dir_path, manifest):
+    with open(os.path.join(dir_path, MANIFEST_FILENAME), 'w') as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+
+
 # Function to download a file from a URL and save it locally
-def downloading(url, outf):
-    if not os.path.exists(outf):
-        print(f"Downloading checkpoint to {outf}")
-        response = requests.get(url, stream=True)
-        total_size_in_bytes = int(response.headers.get('content-length', 0))
-        block_size = 1024  # 1 Kibibyte
-        progress_bar = tqdm(total=total_size_in_bytes, unit='iB', unit_scale=True)
-        with open(outf, 'wb') as file:
-            for data in response.iter_content(block_size):
-                progress_bar.update(len(data))
-                file.write(data)
-        progress_bar.close()
-        if total_size_in_bytes != 0 and progress_bar.n != total_size_in_bytes:
-            print("ERROR, something went wrong")
-        print(f"Downloaded successfully to {outf}")
-    else:
-        return outf
-
-
-def get_efficient_live_portrait():
-    # Download the models and save them in the current working directory
-    current_dir = os.getcwd()
-    face_dir = os.path.join(current_dir, 'live_portrait_weights')
+def downloading(url, outf, manifest=None, position=None):
+    filename = os.path.basename(outf)
+    expected_size = manifest.get(filename) if manifest is not None else None
+    if os.path.exists(outf):
+        # Trust the file without any network request unless it disagrees with the recorded size
+        if expected_size is None or os.path.getsize(outf) == expected_size:
+            return outf
+        tqdm.write(f"Checkpoint {outf} is incomplete, downloading again")
+    tqdm.write(f"Downloading checkpoint to {outf}")
+    response = SESSION.get(url, stream=True)
+    response.raise_for_status()
+    total_size_in_bytes = int(response.headers.get('content-length', 0))
+    block_size = 1 << 20  # 1 Mebibyte
+    # Stream into a temporary file so an interrupted download never leaves a truncated checkpoint behind
+    part_path = outf + '.part'
+    progress_bar = tqdm(total=total_size_in_bytes, unit='iB', unit_scale=True, desc=filename, position=position,
+                        leave=False)
+    with open(part_path, 'wb') as file:
+        for data in response.iter_content(block_size):
+            progress_bar.update(len(data))
+            file.write(data)
+    progress_bar.close()
+    if total_size_in_bytes != 0 and progress_bar.n != total_size_in_bytes:
+        os.remove(part_path)
+        raise RuntimeError(f"Incomplete download for {outf}: got {progress_bar.n} of {total_size_in_bytes} bytes")
+    os.replace(part_path, outf)
+    if manifest is not None:
+        manifest[filename] = os.path.getsize(outf)
+    tqdm.write(f"Downloaded successfully to {outf}")
+    return outf
+
+
+@functools.lru_cache(maxsize=None)
+def ensure_models():
+    # Weights live in one fixed cache directory, independent of the working directory
+    face_dir = os.path.join(CACHE_ROOT, 'live_portrait_weights')
+    sentinel = os.path.join(face_dir, COMPLETE_SENTINEL)
+    is_complete = os.path.exists(sentinel)
     model_paths = {}
+    manifests = {}
+    tasks = []
     for main_key, sub_dict in MODEL_URLS.items():
-        dir_path = os.path.join(current_dir, 'live_portrait_weights', main_key)
-        os.makedirs(dir_path, exist_ok=True)
+        dir_path = os.path.join(face_dir, main_key)
+        if not is_complete:
+            os.makedirs(dir_path, exist_ok=True)
+            manifests[dir_path] = load_manifest(dir_path)
         model_paths[main_key] = {}
         for sub_key, url in sub_dict.items():
             filename = url.split('/')[-1].split('?')[0]
             save_path = os.path.join(dir_path, filename)
-            downloading(url, save_path)
+            if not is_complete:
+                tasks.append((url, save_path, manifests[dir_path]))
             model_paths[main_key][sub_key] = save_path
-        print('Downloaded successfully and already saved')
+    if is_complete:
+        return model_paths, face_dir
+
+    # The checkpoints are independent and network bound, so fetch them concurrently
+    # One progress bar row per worker, taken when a worker starts a file and given back when it finishes
+    positions = queue.Queue()
+    for position in range(DOWNLOAD_WORKERS):
+        positions.put(position)
+
+    def download_in_slot(url, save_path, manifest):
+        position = positions.get()
+        try:
+            return downloading(url, save_path, manifest, position)
+        finally:
+            positions.put(position)
+
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = [executor.submit(download_in_slot, url, save_path, manifest)
+                       for url, save_path, manifest in tasks]
+            for future in as_completed(futures):
+                future.result()
+    finally:
+        # Keep the sizes of the files that did finish, even if another download failed
+        for dir_path, manifest in manifests.items():
+            save_manifest(dir_path, manifest)
+    # Mark the cache complete only when every file matches its recorded size
+    if all(os.path.getsize(save_path) == manifest.get(os.path.basename(save_path), os.path.getsize(save_path))
+           for _, save_path, manifest in tasks):
+        open(sentinel, 'w').close()
+    print('Downloaded successfully and already saved')
     return model_paths, face_dir
 
 
 @dataclass(repr=False)  # use repr from PrintableConfig
 class Config:
-    model_paths, face_dir = get_efficient_live_portrait()
-    grid_sample_3d: str = model_paths['live_portrait']['grid_sample_3d']
+    # checkpoint paths default to the downloaded weights, resolved in __post_init__
+    grid_sample_3d: Optional[str] = None
     # ONNX
-    checkpoint_F: str = model_paths['live_portrait']['F_onnx']  # path to checkpoint
-    checkpoint_M: str = model_paths['live_portrait']['M_onnx']  # path to checkpoint
-    checkpoint_GW: str = model_paths['live_portrait']['GW_onnx']
-    checkpoint_S: str = model_paths['live_portrait']['S_onnx']  # path to checkpoint
-    checkpoint_SE: str = model_paths['live_portrait']['SE_onnx']
-    checkpoint_SL: str = model_paths['live_portrait']['SL_onnx']
+    checkpoint_F: Optional[str] = None  # path to checkpoint
+    checkpoint_M: Optional[str] = None  # path to checkpoint
+    checkpoint_GW: Optional[str] = None
+    checkpoint_S: Optional[str] = None  # path to checkpoint
+    checkpoint_SE: Optional[str] = None
+    checkpoint_SL: Optional[str] = None
 
     # TensorRT FP32
-    F_rt: str = model_paths['live_portrait']['F_rt']  # path to checkpoint
-    M_rt: str = model_paths['live_portrait']['M_rt']  # path to checkpoint
-    GW_rt: str = model_paths['live_portrait']['GW_rt']  # path to checkpoint
-    S_rt: str = model_paths['live_portrait']['S_rt']  # path to checkpoint
-    SE_rt: str = model_paths['live_portrait']['SE_rt']
-    SL_rt: str = model_paths['live_portrait']['SL_rt']
+    F_rt: Optional[str] = None  # path to checkpoint
+    M_rt: Optional[str] = None  # path to checkpoint
+    GW_rt: Optional[str] = None  # path to checkpoint
+    S_rt: Optional[str] = None  # path to checkpoint
+    SE_rt: Optional[str] = None
+    SL_rt: Optional[str] = None
 
     # TensorRT FP16
-    F_rt_half: str = model_paths['live_portrait']['F_rt_half']  # path to checkpoint
-    M_rt_half: str = model_paths['live_portrait']['M_rt_half']  # path to checkpoint
-    GW_rt_half: str = model_paths['live_portrait']['GW_rt_half']  # path to checkpoint
-    S_rt_half: str = model_paths['live_portrait']['S_rt_half']  # path to checkpoint
-    SE_rt_half: str = model_paths['live_portrait']['SE_rt_half']
-    SL_rt_half: str = model_paths['live_portrait']['SL_rt_half']
+    F_rt_half: Optional[str] = None  # path to checkpoint
+    M_rt_half: Optional[str] = None  # path to checkpoint
+    GW_rt_half: Optional[str] = None  # path to checkpoint
+    S_rt_half: Optional[str] = None  # path to checkpoint
+    SE_rt_half: Optional[str] = None
+    SL_rt_half: Optional[str] = None
 
     flag_use_half_precision: bool = True  # whether to use half precision
     flag_lip_zero: bool = True  # whether let the lip to close state before animation, only take effect when flag_eye_retargeting and flag_lip_retargeting is False
@@ -137,23 +251,49 @@ class Config:
     device: str = 'cuda' if torch.cuda.is_available() else 'cpu'
 
     # crop config
-    ckpt_landmark: str = model_paths['insightface']['landmark']
-    ckpt_arc_face: str = model_paths['insightface']['arc_face']
-    ckpt_landmark_106: str = model_paths['insightface']['2d106det']
-    ckpt_det: str = model_paths['insightface']['det_10g']
-    ckpt_face: str = face_dir
+    ckpt_landmark: Optional[str] = None
+    ckpt_arc_face: Optional[str] = None
+    ckpt_landmark_106: Optional[str] = None
+    ckpt_det: Optional[str] = None
+    ckpt_face: Optional[str] = None
     dsize: int = 512  # crop size
     scale: float = 2.3  # scale factor
     vx_ratio: float = 0  # vx ratio
     vy_ratio: float = -0.125  # vy ratio +up, -down
 
+    def __post_init__(self):
+        # Fetch the weights on first instantiation instead of at import time
+        model_paths, face_dir = ensure_models()
+        for field_name, (main_key, sub_key) in CHECKPOINT_FIELDS.items():
+            if getattr(self, field_name) is None:
+                setattr(self, field_name, model_paths[main_key][sub_key])
+        if self.ckpt_face is None:
+            self.ckpt_face = face_dir
+
 
 # Function to save the configuration to a YAML file
 def save_config_to_yaml(filename="efficient-live-portrait.yaml"):
     # Define the path where the YAML file will be saved
     file_path = os.path.join(os.getcwd(), filename)
-    if not os.path.exists(file_path):
-        # Save the configuration to the YAML file
-        with open(file_path, 'w') as file:
-            yaml.safe_dump(asdict(Config()), file)
+    saved = {}
+    if os.path.exists(file_path):
+        with open(file_path, 'r') as file:
+            saved = yaml.safe_load(file) or {}
+        # Cheap existence check so weights deleted since the YAML was written are fetched again
+        missing = [name for name in CHECKPOINT_FIELDS if not saved.get(name) or not os.path.exists(saved[name])]
+        if not missing:
+            return file_path
+        # The cache may still be marked complete, so make ensure_models() look at the files again
+        sentinel = os.path.join(CACHE_ROOT, 'live_portrait_weights', COMPLETE_SENTINEL)
+        if os.path.exists(sentinel):
+            os.remove(sentinel)
+        ensure_models.cache_clear()
+        saved = {name: value for name, value in saved.items()
+                 if name in {f.name for f in fields(Config)} and name not in missing}
+    # Instantiating the config resolves and downloads the weights, so do it before touching the YAML
+    config = Config(**saved)
+    tmp_path = file_path + '.tmp'
+    with open(tmp_path, 'w') as file:
+        yaml.safe_dump(asdict(config), file)
+    os.replace(tmp_path, file_path)
     return file_path
@@ -6,44 +6,99 @@ import tensorrt as trt
 import pycuda.driver as cuda
 import pycuda.gpuarray
 import pycuda.autoinit
+import pycuda.tools
 import numpy as np
+import torch
 import ctypes
-
-TRT_LOGGER = trt.Logger(trt.Logger.WARNING)
+import functools
+import os
+
+# Only errors reach the Python logger by default; set TRT_LOG_WARN=1 to also surface warnings
+TRT_LOGGER = trt.Logger(trt.Logger.WARNING if os.environ.get('TRT_LOG_WARN') == '1' else trt.Logger.ERROR)
+
+# Deserialized engines shared by TensorRTEngine instances on the same CUDA context:
+# {context handle: {'users': live engines on it, 'engines': {engine path: (mtime, engine)}}}.
+# An entry is dropped as soon as its last user goes away, so a handle reused by a later context never sees it.
+_ENGINE_CACHE = {}
+_RUNTIME = None
+
+
+def _acquire_engine_cache(cuda_ctx):
+    entry = _ENGINE_CACHE.setdefault(cuda_ctx.handle, {'users': 0, 'engines': {}})
+    entry['users'] += 1
+
+
+def _release_engine_cache(cuda_ctx):
+    entry = _ENGINE_CACHE.get(cuda_ctx.handle)
+    if entry is None:
+        return
+    entry['users'] -= 1
+    if entry['users'] <= 0:
+        del _ENGINE_CACHE[cuda_ctx.handle]
+
+
+_TRT_TO_NP = {
+    trt.DataType.FLOAT: np.float32,
+    trt.DataType.HALF: np.float16,
+    trt.DataType.INT8: np.int8,
+    trt.DataType.BOOL: np.bool_,
+}
+if hasattr(trt.DataType, 'INT32'):
+    _TRT_TO_NP[trt.DataType.INT32] = np.int32
+if hasattr(trt.DataType, 'INT64'):
+    _TRT_TO_NP[trt.DataType.INT64] = np.int64
+
+NP_TO_TORCH = {
+    np.float32: torch.float32,
+    np.float16: torch.float16,
+    np.int8: torch.int8,
+    np.int32: torch.int32,
+    np.int64: torch.int64,
+    np.bool_: torch.bool,
+}
 
 
 class Binding:
-    def __init__(self, engine, idx_or_name):
+    __slots__ = ('name', 'is_input', 'dtype', 'shape', 'host_pool', 'device_pool', '_host_buf', '_device_buf',
+                 '_pinned_in')
+
+    def __init__(self, engine, idx_or_name, host_pool=None, device_pool=None):
         self.name = idx_or_name if isinstance(idx_or_name, str) else engine.get_tensor_name(idx_or_name)
         if not self.name:
             raise IndexError(f"Binding index out of range: {idx_or_name}")
         self.is_input = engine.get_tensor_mode(self.name) == trt.TensorIOMode.INPUT
         dtype = engine.get_tensor_dtype(self.name)
-        dtype_map = {
-            trt.DataType.FLOAT: np.float32,
-            trt.DataType.HALF: np.float16,
-            trt.DataType.INT8: np.int8,
-            trt.DataType.BOOL: np.bool_,
-        }
-        if hasattr(trt.DataType, 'INT32'):
-            dtype_map[trt.DataType.INT32] = np.int32
-        if hasattr(trt.DataType, 'INT64'):
-            dtype_map[trt.DataType.INT64] = np.int64
-        self.dtype = dtype_map[dtype]
+        self.dtype = _TRT_TO_NP[dtype]
         self.shape = tuple(engine.get_tensor_shape(self.name))
+        self.host_pool = host_pool
+        self.device_pool = device_pool
         self._host_buf = None
         self._device_buf = None
+        self._pinned_in = None
 
     @property
     def host_buffer(self):
         if self._host_buf is None:
-            self._host_buf = cuda.pagelocked_empty(self.shape, self.dtype)
+            if self.host_pool is not None:
+                self._host_buf = self.host_pool.allocate(self.shape, self.dtype)
+            else:
+                self._host_buf = cuda.pagelocked_empty(self.shape, self.dtype)
         return self._host_buf
 
+    @property
+    def pinned_input(self):
+        # Persistent pinned staging buffer so input uploads are real DMA transfers
+        if self._pinned_in is None:
+            self._pinned_in = cuda.pagelocked_empty(self.shape, self.dtype)
+        return self._pinned_in
+
     @property
     def device_buffer(self):
         if self._device_buf is None:
-            self._device_buf = pycuda.gpuarray.empty(self.shape, self.dtype)
+            if self.device_pool is not None:
+                self._device_buf = pycuda.gpuarray.empty(self.shape, self.dtype, allocator=self.device_pool.allocate)
+            else:
+                self._device_buf = pycuda.gpuarray.empty(self.shape, self.dtype)
         return self._device_buf
 
     def get_async(self, stream):
@@ -55,6 +110,8 @@ class Binding:
             del self._host_buf
         if self._device_buf is not None:
             del self._device_buf
+        if self._pinned_in is not None:
+            del self._pinned_in
 
 
 class TensorRTEngine:
@@ -66,6 +123,7 @@ class TensorRTEngine:
             self.cfx = cuda.Device(0).make_context()
         else:
             self.cfx = kwargs.get("cuda_ctx")
+        _acquire_engine_cache(self.cfx)
 
         if half:
             self.model_paths = {
@@ -93,7 +151,19 @@ class TensorRTEngine:
         self.binding_addresses = {}
         self.inputs = {}
         self.outputs = {}
-        self.stream = cuda.Stream()
+        self.tensor_names = {}
+        self.shape_infer_io = {}
+        self.input_shape_io = {}
+        self.graphs = {}
+        self.fast = {}
+        self.validators = {}
+        self.batch_slots = {}
+        self.pending_events = {}
+        self.streams = {}
+        self.host_pool = pycuda.tools.PageLockedMemoryPool()
+        # Device memory belongs to self.cfx, so the pool is owned by the engine and never shared across contexts;
+        # freed blocks are re-bucketed by size instead of going back to the driver
+        self.device_pool = pycuda.tools.DeviceMemoryPool()
         self.initialize_engines()
 
     def load_plugins(self, logger: trt.Logger):
@@ -102,29 +172,83 @@ class TensorRTEngine:
 
     def initialize_engines(self):
         for model_name, model_path in self.model_paths.items():
-            engine = self.load_engine(model_path)
+            engine = self.load_engine(model_path, self.cfx)
             if engine is None:
                 raise RuntimeError(f"Failed to load engine for {model_name}")
             context = engine.create_execution_context()
             if context is None:
                 raise RuntimeError(f"Failed to create execution context for {model_name}")
-            bindings = [Binding(engine, i) for i in range(engine.num_io_tensors)]
+            bindings = [Binding(engine, i, self.host_pool, self.device_pool) for i in range(engine.num_io_tensors)]
             self.engines[model_name] = engine
             self.contexts[model_name] = context
             self.bindings[model_name] = bindings
+            self.streams[model_name] = cuda.Stream()  # One stream per model so independent models can overlap
             self.binding_addresses[model_name] = [b.device_buffer.ptr for b in bindings]
             self.inputs[model_name] = [b for b in bindings if b.is_input]
             self.outputs[model_name] = [b for b in bindings if not b.is_input]
             self.prepare_buffers(model_name)
+            self.tensor_names[model_name] = [b.name for b in bindings]
+            self.shape_infer_io[model_name] = [engine.is_shape_inference_io(b.name) for b in bindings]
+            # Same flags restricted to the input bindings, in input order
+            self.input_shape_io[model_name] = tuple(engine.is_shape_inference_io(b.name)
+                                                    for b in self.inputs[model_name])
+            # All addresses are stable, so bind them once: device buffers for regular tensors, and the pinned
+            # staging buffer for shape-inference inputs, which TensorRT reads from host memory
+            for binding, address, is_shape_io in zip(bindings, self.binding_addresses[model_name],
+                                                     self.shape_infer_io[model_name]):
+                if is_shape_io:
+                    address = binding.pinned_input.ctypes.data
+                context.set_tensor_address(binding.name, address)
+            self.fast[model_name] = self.build_fast_path(model_name)
+            self.validators[model_name] = self.compile_validator(model_name)
+
+    def build_fast_path(self, model_name):
+        # Everything run_sequential_tasks touches per call, flattened into one tuple of plain values
+        in_bindings = tuple(self.inputs[model_name])
+        out_bindings = tuple(self.outputs[model_name])
+        return (
+            self.contexts[model_name],
+            tuple(b.name for b in in_bindings),
+            in_bindings,
+            tuple(b.device_buffer.ptr for b in in_bindings),
+            tuple(b.pinned_input for b in in_bindings),
+            tuple(b.device_buffer.ptr for b in out_bindings),
+            tuple(b.host_buffer for b in out_bindings),
+            tuple(b.shape for b in out_bindings),
+            tuple(b.dtype for b in out_bindings),
+            tuple(b.device_buffer.nbytes for b in out_bindings),
+            self.streams[model_name],
+            self.streams[model_name].handle,
+        )
 
     @staticmethod
-    def load_engine(engine_file_path):
-        with open(engine_file_path, "rb") as f, trt.Runtime(TRT_LOGGER) as runtime:
-            return runtime.deserialize_cuda_engine(f.read())
+    def load_engine(engine_file_path, cuda_ctx):
+        global _RUNTIME
+        # Engines hold device memory of the context they were deserialized in, so the cache is per context
+        # Only contexts with a registered TensorRTEngine are cached, since only those get released
+        entry = _ENGINE_CACHE.get(cuda_ctx.handle)
+        engines = entry['engines'] if entry is not None else {}
+        mtime = os.path.getmtime(engine_file_path)
+        cached = engines.get(engine_file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        if _RUNTIME is None:
+            _RUNTIME = trt.Runtime(TRT_LOGGER)  # Kept alive for as long as the engines it created
+        cuda_ctx.push()
+        try:
+            with open(engine_file_path, "rb") as f:
+                engine = _RUNTIME.deserialize_cuda_engine(f.read())
+        finally:
+            cuda_ctx.pop()
+        if engine is not None:
+            engines[engine_file_path] = (mtime, engine)  # Replaces the entry of a stale mtime
+        return engine
 
     def prepare_buffers(self, model_name):
         for binding in self.inputs[model_name] + self.outputs[model_name]:
             _ = binding.device_buffer  # Force buffer allocation
+        for binding in self.outputs[model_name]:
+            _ = binding.host_buffer  # Pinned host output reused by every call
 
     @staticmethod
     def check_input_validity(input_idx, input_array, input_binding):
@@ -141,55 +265,206 @@ class TensorRTEngine:
             else:
                 raise TypeError(
                     f"Wrong dtype for input {input_idx}. Expected {input_binding.dtype}, got {input_array.dtype}.")
+        if not input_array.flags['C_CONTIGUOUS']:
+            input_array = np.ascontiguousarray(input_array)
         return input_array
 
+    @staticmethod
+    def is_cuda_tensor(input_array):
+        return isinstance(input_array, torch.Tensor) and input_array.is_cuda
+
+    @staticmethod
+    def check_tensor_validity(input_idx, input_tensor, input_binding):
+        if tuple(input_tensor.shape) != input_binding.shape:
+            if not (input_binding.shape == (1,) and input_tensor.dim() == 0):
+                raise ValueError(
+                    f"Wrong shape for input {input_idx}. Expected {input_binding.shape}, got {tuple(input_tensor.shape)}.")
+        expected_dtype = NP_TO_TORCH[input_binding.dtype]
+        if input_tensor.dtype != expected_dtype:
+            if input_tensor.dtype == torch.int64 and expected_dtype == torch.int32:
+                casted = input_tensor.to(torch.int32)
+                if not torch.equal(casted.to(torch.int64), input_tensor):
+                    raise TypeError(
+                        f"Wrong dtype for input {input_idx}. Expected {expected_dtype}, got {input_tensor.dtype}. Cannot safely cast.")
+                input_tensor = casted
+            else:
+                raise TypeError(
+                    f"Wrong dtype for input {input_idx}. Expected {expected_dtype}, got {input_tensor.dtype}.")
+        return input_tensor.contiguous()
+
+    def compile_validator(self, model_name):
+        # Expected shape/dtype per input are fixed by the engine, so bind them once into a per-model checker;
+        # the checker is static so it does not hold a reference back to the engine
+        specs = tuple((b.shape, np.dtype(b.dtype), NP_TO_TORCH[b.dtype], is_shape_io)
+                      for b, is_shape_io in zip(self.inputs[model_name], self.input_shape_io[model_name]))
+        return functools.partial(TensorRTEngine.validate_inputs, model_name, specs, tuple(self.inputs[model_name]))
+
+    @staticmethod
+    def validate_inputs(model_name, specs, bindings, inputs):
+        if len(inputs) != len(specs):
+            raise ValueError(f"Number of input arrays does not match number of input bindings for model {model_name}.")
+        validated = []
+        for i, (input_array, (shape, dtype, tensor_dtype, is_shape_io)) in enumerate(zip(inputs, specs)):
+            if TensorRTEngine.is_cuda_tensor(input_array):
+                if not is_shape_io:
+                    if input_array.shape == shape and input_array.dtype == tensor_dtype and input_array.is_contiguous():
+                        validated.append(input_array)
+                    else:
+                        validated.append(TensorRTEngine.check_tensor_validity(i, input_array, bindings[i]))
+                    continue
+                input_array = input_array.cpu()  # Shape-inference inputs are read from host memory
+            input_array = np.asarray(input_array)
+            if input_array.shape == shape and input_array.dtype == dtype and input_array.flags['C_CONTIGUOUS']:
+                validated.append(input_array)
+            else:
+                # Slow path: scalar reshaping, int64 downcast or contiguity fix-up
+                validated.append(TensorRTEngine.check_input_validity(i, input_array, bindings[i]))
+        return validated
+
+    def capture_graph(self, model_name):
+        # Shape-inference inputs are read on the host at enqueue time, which a graph cannot replay
+        if any(self.shape_infer_io[model_name]):
+            return None
+        stream = self.streams[model_name]
+        try:
+            stream.begin_capture()
+            try:
+                enqueued = self.contexts[model_name].execute_async_v3(stream.handle)
+            finally:
+                graph = stream.end_capture()
+            if not enqueued:
+                # A failed enqueue can still leave a valid but empty capture, which would replay no kernels
+                print(f"CUDA graph capture failed for model {model_name}, using regular execution")
+                return None
+            return graph.instantiate()
+        except Exception as e:
+            print(f"CUDA graph capture failed for model {model_name}, using regular execution: {e}")
+            return None
+
     def run_sequential_tasks(self, model_name, inputs):
-        if model_name not in self.engines:
+        outputs, _ = self.submit_tasks(model_name, [inputs])
+        return None if outputs is None else outputs[0]
+
+    def submit_tasks(self, model_name, inputs_list, slots=None, synchronize=True):
+        fast = self.fast.get(model_name)
+        if fast is None:
             raise ValueError(f"Model name {model_name} not found in engines.")
-        engine = self.engines[model_name]
-        context = self.contexts[model_name]
-        binding_addresses = self.binding_addresses[model_name]
-        inputs_bindings = self.inputs[model_name]
-        outputs_bindings = self.outputs[model_name]
-
-        if isinstance(inputs, dict):
-            inputs = [inputs[b.name] for b in inputs_bindings]
-        if len(inputs) != len(inputs_bindings):
-            raise ValueError(f"Number of input arrays does not match number of input bindings for model {model_name}.")
+        in_names = fast[1]
+        stream = fast[-2]
+
+        inputs_list = [[inputs[name] for name in in_names] if isinstance(inputs, dict) else inputs
+                       for inputs in inputs_list]
+        for inputs in inputs_list:
+            if len(inputs) != len(in_names):
+                raise ValueError(
+                    f"Number of input arrays does not match number of input bindings for model {model_name}.")
+
+        # CUDA tensors are copied device-to-device and the outputs are handed back as CUDA tensors
+        cuda_device = next((x.device for inputs in inputs_list for x in inputs if self.is_cuda_tensor(x)), None)
+        if cuda_device is not None:
+            torch.cuda.current_stream(cuda_device).synchronize()  # Inputs must be ready before our stream reads them
 
         self.cfx.push()  # Push CUDA context
 
+        # An unfinished async call still reads the staging buffers and owns the outputs we would overwrite
+        pending = self.pending_events.get(model_name)
+        if pending is not None:
+            if not pending[0].query():
+                self.cfx.pop()
+                raise RuntimeError(
+                    f"Model {model_name} has an unfinished async inference, call wait(event) before running it again.")
+            del self.pending_events[model_name]
+
         try:
-            for i, (input_array, input_binding) in enumerate(zip(inputs, inputs_bindings)):
-                input_array = self.check_input_validity(i, input_array, input_binding)
-                input_array = np.ascontiguousarray(input_array)  # Ensure the input array is contiguous
-                cuda.memcpy_htod(input_binding.device_buffer.ptr, input_array)
-
-            for i in range(engine.num_io_tensors):
-                tensor_name = engine.get_tensor_name(i)
-                if i < len(inputs) and engine.is_shape_inference_io(tensor_name):
-                    context.set_tensor_address(tensor_name, inputs[i].ctypes.data)
-                else:
-                    context.set_tensor_address(tensor_name, binding_addresses[i])
-
-            context.execute_async_v3(self.stream.handle)
-            self.stream.synchronize()
-
-            outputs = []
-            for output in outputs_bindings:
-                host_output = np.empty(output.shape, dtype=output.dtype)
-                cuda.memcpy_dtoh(host_output, output.device_buffer.ptr)
-                outputs.append(host_output)
+            results = []
+            for n, inputs in enumerate(inputs_list):
+                in_pinned, out_host = slots[n] if slots is not None else (None, None)
+                results.append(self.enqueue_task(model_name, fast, inputs, cuda_device, in_pinned, out_host))
+
+            if synchronize:
+                stream.synchronize()
+                event = None
+            else:
+                event = cuda.Event()
+                event.record(stream)
+                # The copies are still queued: keep the (possibly validated copies of the) inputs alive until
+                # wait(event), and tell torch's allocator that CUDA outputs are written on the engine's stream
+                self.pending_events[model_name] = (event, inputs_list)
+                if cuda_device is not None:
+                    engine_stream = torch.cuda.ExternalStream(stream.handle, device=cuda_device)
+                    for outputs in results:
+                        for output in outputs:
+                            output.record_stream(engine_stream)
 
         except Exception as e:
             print(f"Error during inference for model {model_name}: {e}")
-            outputs = None
+            results, event = None, None
 
         self.cfx.pop()  # Pop CUDA context
 
+        return results, event
+
+    def enqueue_task(self, model_name, fast, inputs, cuda_device, in_pinned=None, out_host=None):
+        (context, in_names, in_bindings, in_ptrs, default_pinned,
+         out_ptrs, default_host, out_shapes, out_dtypes, out_nbytes, stream, stream_handle) = fast
+        in_pinned = default_pinned if in_pinned is None else in_pinned
+        out_host = default_host if out_host is None else out_host
+        is_cuda_tensor = self.is_cuda_tensor
+
+        # inference_tensorrt validates its inputs; these guards only keep direct run_sequential_tasks callers
+        # from writing past the fixed-size binding buffers or being silently cast
+        for i, input_array in enumerate(inputs):
+            staging = in_pinned[i]
+            if is_cuda_tensor(input_array):
+                nbytes = input_array.numel() * input_array.element_size()
+                if (nbytes != staging.nbytes or input_array.dtype != NP_TO_TORCH[staging.dtype.type]
+                        or not input_array.is_contiguous()):
+                    raise ValueError(
+                        f"Wrong input {i} for model {model_name}. Expected a contiguous {staging.dtype} tensor of "
+                        f"shape {staging.shape}, got {input_array.dtype} of shape {tuple(input_array.shape)}.")
+                cuda.memcpy_dtod_async(in_ptrs[i], input_array.data_ptr(), nbytes, stream)
+                continue
+            input_array = np.asarray(input_array)
+            if input_array.size != staging.size:
+                raise ValueError(
+                    f"Wrong shape for input {i} of model {model_name}. Expected {staging.shape}, got {input_array.shape}.")
+            np.copyto(staging, input_array, casting='no')
+            cuda.memcpy_htod_async(in_ptrs[i], staging, stream)
+
+        graph_exec = self.graphs.get(model_name)
+        if graph_exec is not None:
+            graph_exec.launch(stream)
+        else:
+            if not context.execute_async_v3(stream_handle):
+                raise RuntimeError(f"TensorRT failed to enqueue model {model_name}")
+            if model_name not in self.graphs:
+                # Capture once after the first real run, then replay every kernel with a single launch
+                self.graphs[model_name] = self.capture_graph(model_name)
+
+        # Host outputs are persistent pinned buffers: they are overwritten by the next call
+        # for this model, so callers that keep a result around must copy it first
+        outputs = []
+        for ptr, host_output, shape, dtype, nbytes in zip(out_ptrs, out_host, out_shapes, out_dtypes, out_nbytes):
+            if cuda_device is not None:
+                device_output = torch.empty(shape, dtype=NP_TO_TORCH[dtype], device=cuda_device)
+                cuda.memcpy_dtod_async(device_output.data_ptr(), ptr, nbytes, stream)
+                outputs.append(device_output)
+                continue
+            cuda.memcpy_dtoh_async(host_output, ptr, stream)
+            outputs.append(host_output)
         return outputs
 
-    def inference_tensorrt(self, task, inputs):
+    def get_batch_slots(self, model_name, batch_size):
+        # One pinned input/output set per queued frame, so staging a frame never overwrites one still in flight
+        slots = self.batch_slots.setdefault(model_name, [])
+        while len(slots) < batch_size:
+            slots.append((
+                tuple(cuda.pagelocked_empty(b.shape, b.dtype) for b in self.inputs[model_name]),
+                tuple(cuda.pagelocked_empty(b.shape, b.dtype) for b in self.outputs[model_name]),
+            ))
+        return slots
+
+    def prepare_inputs(self, task, inputs):
         if not isinstance(inputs, list):
             raise TypeError("Inputs should be a list of numpy arrays or tensors.")
 
@@ -206,12 +481,69 @@ class TensorRTEngine:
             inputs = [input_array.get() if isinstance(input_array, pycuda.gpuarray.GPUArray) else input_array
                       for input_array in inputs]
 
-        inputs = [self.check_input_validity(i, np.array(input_array), self.inputs[task][i])
-                  for i, input_array in enumerate(inputs)]
+        return self.validators[task](inputs)
 
+    def inference_tensorrt(self, task, inputs):
+        inputs = self.prepare_inputs(task, inputs)
         result = self.run_sequential_tasks(task, inputs)
         return result
 
+    def inference_tensorrt_async(self, task, inputs):
+        """
+        Queue inference on the model's own stream and return without waiting for it.
+
+        Models run on separate streams, so independent heads (e.g. eye and lip retargeting) can overlap.
+
+        Args:
+        - task (str): The name of the model to run.
+        - inputs (list): A list of numpy arrays or tensors.
+
+        Returns:
+        - (cuda.Event, list): Event recorded after the outputs are copied, and the outputs themselves,
+          which are only valid once `wait(event)` has returned.
+
+        The model's staging and output buffers stay in use until then, so running the same model again
+        (sync, async or batched) before the event completes raises a RuntimeError. The engine keeps the
+        inputs alive until `wait(event)`, but CUDA tensor inputs are read in place and must not be modified
+        before then.
+        """
+        inputs = self.prepare_inputs(task, inputs)
+        results, event = self.submit_tasks(task, [inputs], synchronize=False)
+        return event, None if results is None else results[0]
+
+    def inference_tensorrt_batch(self, task, inputs_list):
+        """
+        Queue inference for several frames on the model's stream and synchronize once at the end.
+
+        Args:
+        - task (str): The name of the model to run.
+        - inputs_list (list): One list of numpy arrays or tensors per frame.
+
+        Returns:
+        - list: The outputs of each frame. Host outputs live in per-frame pinned slots that are reused
+          by the next batch call for this model.
+        """
+        if task not in self.inputs:
+            raise ValueError(f"Task {task} not found in the model inputs.")
+        if any(self.input_shape_io[task]):
+            # Shape-inference inputs are bound to a single host staging buffer, so frames cannot be queued ahead
+            raise ValueError(f"Batched inference is not supported for model {task} with shape-inference inputs.")
+        inputs_list = [self.prepare_inputs(task, inputs) for inputs in inputs_list]
+        slots = self.get_batch_slots(task, len(inputs_list))
+        results, _ = self.submit_tasks(task, inputs_list, slots=slots)
+        return results
+
+    def wait(self, event):
+        if event is None:
+            return
+        self.cfx.push()
+        try:
+            event.synchronize()
+        finally:
+            self.cfx.pop()
+        for model_name in [name for name, pending in self.pending_events.items() if pending[0] is event]:
+            del self.pending_events[model_name]
+
     def __del__(self):
         del self.engines
         del self.contexts
@@ -219,9 +551,21 @@ class TensorRTEngine:
         del self.binding_addresses
         del self.inputs
         del self.outputs
-        del self.stream
+        del self.tensor_names
+        del self.shape_infer_io
+        del self.input_shape_io
+        del self.graphs
+        del self.fast
+        del self.validators
+        del self.batch_slots
+        del self.pending_events
+        del self.streams
+        del self.host_pool
+        del self.device_pool
         try:
             if self.cfx is not None:
+                # Drop the cached engines once no TensorRTEngine uses this context anymore
+                _release_engine_cache(self.cfx)
                 self.cfx.pop()
                 del self.cfx
         except Exception as e:
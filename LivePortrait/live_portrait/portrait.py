@@ -179,7 +179,7 @@ class PortraitController(ParsingPaste, FaceCropper):
         inputs = {'img': np.array(source)}
         outputs = self.predictor.run_time(engine_name='feature_extractor', task='f_session', inputs_onnx=inputs,
                                           inputs_tensorrt=[source])
-        return outputs[0]
+        return np.array(outputs[0])  # the feature is kept across frames, detach it from the engine's output buffer
 
     def warp_decode(self, feature_3d, kp_source, kp_driving):
         inputs = {
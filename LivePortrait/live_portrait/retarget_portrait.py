@@ -47,7 +47,7 @@ class RetargetStitchPortrait:
         # Perform inference with the selected task
         delta = stitch_session.run_time(engine_name=engine_name, task=task, inputs_onnx=inputs, inputs_tensorrt=[feat])
 
-        return delta[0]
+        return np.array(delta[0])  # lip deltas are kept across frames, detach them from the engine's output buffer
 
     def stitch(self, session, kp_source: torch.Tensor, kp_driving: torch.Tensor):
         """